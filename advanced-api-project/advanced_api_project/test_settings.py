@@ -0,0 +1,30 @@
+"""
+Test settings for advanced_api_project.
+
+Extends the regular settings with overrides that only make sense for the
+test suite:
+- MD5PasswordHasher: the default PBKDF2 hasher runs hundreds of thousands of
+  iterations per create_user()/login(); test passwords never leave the test
+  database, so a single cheap hash is enough.
+- In-memory SQLite database, for the test database as well: no file is
+  created or migrated on disk, so there is nothing for --keepdb to reuse.
+  When pointing the suite at a file-backed or server database instead, run
+  with --keepdb to skip re-creating and re-migrating it on every run.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=advanced_api_project.test_settings python manage.py test api
+    
+    # File-backed/server database: reuse the test database between runs
+    DJANGO_SETTINGS_MODULE=advanced_api_project.test_settings python manage.py test api --keepdb
+"""
+from .settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+DATABASES['default'] = {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': ':memory:',
+    'TEST': {'NAME': ':memory:'},
+}
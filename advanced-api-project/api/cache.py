@@ -0,0 +1,63 @@
+"""
+Response caching helpers for the Book and Author list endpoints.
+
+List responses are cached under a key built from the request scheme, host
+and path, the sorted query parameters and a shared "list version" number;
+the same pair serves as the list ETag. Any change to a Book or Author bumps the version
+(see the receivers in models.py), which makes every previously cached list
+response unreachable, and every issued ETag stale, at once without having
+to enumerate or pattern-delete keys.
+"""
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+
+LIST_CACHE_VERSION_KEY = 'api:list_version'
+LIST_CACHE_TIMEOUT = 60 * 5
+
+
+def get_list_cache_version():
+    """Returns the current list version, initialising it on first use."""
+    return cache.get_or_set(LIST_CACHE_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def bump_list_cache_version():
+    """Invalidates every cached list response by moving to a new version."""
+    try:
+        cache.incr(LIST_CACHE_VERSION_KEY)
+    except ValueError:
+        # Key missing (never set, or evicted). Seed from the clock rather than 1
+        # so a reset can never land on a version that still has entries.
+        cache.set(LIST_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def _request_digest(request):
+    """
+    Hashes the request scheme, host, path and query parameters.
+
+    Query parameters are sorted so '?a=1&b=2' and '?b=2&a=1' share a digest.
+    The scheme and host are included because paginated responses carry
+    absolute next/previous links built from them.
+    """
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    url = f"{request.scheme}://{request.get_host()}{request.path}?{query}"
+    return hashlib.sha1(url.encode()).hexdigest()
+
+
+def list_cache_key(request):
+    """Builds the cache key for a list request."""
+    return f"api:list:{get_list_cache_version()}:{_request_digest(request)}"
+
+
+def list_etag(request, *args, **kwargs):
+    """
+    Builds the ETag for a list request.
+
+    It changes exactly when the cached list would, so a client's
+    If-None-Match can be answered with a 304 without touching the database.
+    The negotiated renderer format is part of it, since the JSON and
+    browsable API representations of the same list are different bodies.
+    """
+    return f"{get_list_cache_version()}-{_request_digest(request)}-{request.accepted_renderer.format}"
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_book_author_related_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='publication_year',
+            field=models.IntegerField(db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['author', 'publication_year'], name='api_book_author__e0f153_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:55
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_book_publication_year_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='name_ci',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Lower('name'), output_field=models.CharField(max_length=100)),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='title_ci',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Lower('title'), output_field=models.CharField(max_length=100)),
+        ),
+    ]
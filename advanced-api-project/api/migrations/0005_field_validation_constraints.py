@@ -0,0 +1,43 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:59
+
+import django.core.validators
+import django.db.models.functions.text
+import django.db.models.lookups
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_case_folded_name_and_title'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='author',
+            name='name',
+            field=models.CharField(max_length=100, validators=[django.core.validators.MinLengthValidator(3, 'Name must be at least 3 characters long')]),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='publication_year',
+            field=models.IntegerField(db_index=True, validators=[django.core.validators.MinValueValidator(1900, 'Publication year must be greater than 1900')]),
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='title',
+            field=models.CharField(max_length=100, validators=[django.core.validators.MinLengthValidator(3, 'Title must be at least 3 characters long')]),
+        ),
+        migrations.AddConstraint(
+            model_name='author',
+            constraint=models.CheckConstraint(condition=django.db.models.lookups.GreaterThanOrEqual(django.db.models.functions.text.Length('name'), 3), name='author_name_min_length'),
+        ),
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.CheckConstraint(condition=models.Q(('publication_year__gte', 1900)), name='book_publication_year_gte_1900'),
+        ),
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.CheckConstraint(condition=django.db.models.lookups.GreaterThanOrEqual(django.db.models.functions.text.Length('title'), 3), name='book_title_min_length'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:59
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_field_validation_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='title',
+            field=models.CharField(db_index=True, max_length=100, validators=[django.core.validators.MinLengthValidator(3, 'Title must be at least 3 characters long')]),
+        ),
+    ]
@@ -1,4 +1,10 @@
+from django.core.validators import MinLengthValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Length, Lower
+from django.db.models.lookups import GreaterThanOrEqual
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import bump_list_cache_version
 
 # Create your models here.
 
@@ -10,7 +16,10 @@ class Author(models.Model):
     about authors who have written books.
     
     Attributes:
-        name (CharField): The full name of the author. Maximum length is 100 characters.
+        name (CharField): The full name of the author. Between 3 and 100 characters.
+        name_ci (GeneratedField): Lowercased copy of name maintained by the database
+                                  and indexed, so case-insensitive name filters
+                                  compare against it instead of UPPER(name).
         
     Relationships:
         - Has a one-to-many relationship with Book model (one author can have many books)
@@ -19,7 +28,24 @@ class Author(models.Model):
     Example:
         author = Author.objects.create(name="J.K. Rowling")
     """
-    name = models.CharField(max_length=100)
+    name = models.CharField(
+        max_length=100,
+        validators=[MinLengthValidator(3, "Name must be at least 3 characters long")],
+    )
+    name_ci = models.GeneratedField(
+        expression=Lower('name'),
+        output_field=models.CharField(max_length=100),
+        db_persist=True,
+        db_index=True,
+    )
+    
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=GreaterThanOrEqual(Length('name'), 3),
+                name='author_name_min_length',
+            ),
+        ]
     
     def __str__(self):
         """String representation of the Author model."""
@@ -34,16 +60,31 @@ class Book(models.Model):
     through a foreign key relationship.
     
     Attributes:
-        title (CharField): The title of the book. Maximum length is 100 characters.
-        publication_year (IntegerField): The year the book was published.
+        title (CharField): The title of the book. Between 3 and 100 characters.
+                           Indexed to serve the exact title filter.
+        title_ci (GeneratedField): Lowercased copy of title maintained by the database
+                                   and indexed, so the case-insensitive exact title
+                                   filter can use a plain B-tree lookup.
+        publication_year (IntegerField): The year the book was published (1900 or
+                                         later). Indexed to serve the book list
+                                         year lookups.
         author (ForeignKey): A foreign key reference to the Author model.
                            Uses CASCADE deletion, meaning if an author is deleted,
-                           all their books will also be deleted.
+                           all their books will also be deleted. The reverse
+                           accessor is named 'books' (related_name).
+        updated_at (DateTimeField): Set on every save (auto_now) and indexed. Used
+                                    as the Last-Modified time of the detail endpoint.
     
     Relationships:
         - Many-to-one relationship with Author (many books can belong to one author)
         - The ForeignKey creates a reverse relationship on Author, accessible via
-          author.book_set or author.books (if related_name is specified)
+          author.books (related_name), which also matches the nested 'books'
+          field on AuthorSerializer and the prefetch_related('books') lookup
+    
+    Validation:
+        The length and year bounds are declared as field validators, which
+        ModelSerializer picks up automatically, and enforced again by
+        database CheckConstraints.
     
     Example:
         book = Book.objects.create(
@@ -52,10 +93,48 @@ class Book(models.Model):
             author=author_instance
         )
     """
-    title = models.CharField(max_length=100)
-    publication_year = models.IntegerField()
-    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+    title = models.CharField(
+        max_length=100,
+        db_index=True,
+        validators=[MinLengthValidator(3, "Title must be at least 3 characters long")],
+    )
+    title_ci = models.GeneratedField(
+        expression=Lower('title'),
+        output_field=models.CharField(max_length=100),
+        db_persist=True,
+        db_index=True,
+    )
+    publication_year = models.IntegerField(
+        db_index=True,
+        validators=[MinValueValidator(1900, "Publication year must be greater than 1900")],
+    )
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='books')
+    # Backs the Last-Modified header of the book detail endpoint
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    
+    class Meta:
+        # Serves the combined "author + year range" filter exposed by BookFilterBackend
+        indexes = [
+            models.Index(fields=['author', 'publication_year']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(publication_year__gte=1900),
+                name='book_publication_year_gte_1900',
+            ),
+            models.CheckConstraint(
+                condition=GreaterThanOrEqual(Length('title'), 3),
+                name='book_title_min_length',
+            ),
+        ]
     
     def __str__(self):
         """String representation of the Book model."""
-        return f"{self.title} by {self.author.name}"
\ No newline at end of file
+        return f"{self.title} by {self.author.name}"
+
+
+# Any Book/Author write invalidates the cached list responses (see api/cache.py)
+@receiver([post_save, post_delete], sender=Author)
+@receiver([post_save, post_delete], sender=Book)
+def invalidate_list_cache(sender, **kwargs):
+    bump_list_cache_version()
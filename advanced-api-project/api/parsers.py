@@ -0,0 +1,25 @@
+"""
+JSON parser backed by orjson, the request-side counterpart of
+api.renderers.ORJSONRenderer.
+"""
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    Drop-in replacement for JSONParser.
+    
+    orjson only accepts UTF-8 (the encoding JSON requires) and rejects NaN
+    and Infinity, matching DRF's STRICT_JSON default.
+    """
+    renderer_class = ORJSONRenderer
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
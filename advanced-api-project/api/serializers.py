@@ -1,3 +1,5 @@
+from django.db.models import Count, Prefetch
+from django.urls import reverse
 from rest_framework import serializers
 from .models import Author, Book
 
@@ -10,7 +12,8 @@ class BookSerializer(serializers.ModelSerializer):
     and vice versa.
     
     Purpose:
-        - Validates incoming book data during creation/updates
+        - Validates incoming book data during creation/updates (title length and
+          publication year bounds come from the model field validators)
         - Converts Book model instances to JSON for API responses
         - Handles the foreign key relationship with Author (author field)
     
@@ -20,22 +23,30 @@ class BookSerializer(serializers.ModelSerializer):
         - publication_year: The year the book was published
         - author: Foreign key to Author (represented as author ID in JSON)
     
+    Field Selection:
+        When the serializer context carries a 'fields' set (EagerLoadingMixin
+        passes the ?fields= names), only those fields are serialized. Names
+        that are not fields of this serializer are ignored; if none match,
+        every field is serialized.
+    
     Usage:
         Used in API endpoints to serialize book data for GET, POST, PUT, PATCH requests.
     """
     class Meta:
         model = Book
-        fields = '__all__'
-    
-    def validate_publication_year(self, value):
-        if value < 1900:
-            raise serializers.ValidationError("Publication year must be greater than 1900")
-        return value
+        # Explicit list (not '__all__'): the book list reads exactly these
+        # columns with values() (ValuesListMixin) and the export's .only()
+        # projection must match them, or a missing field would be re-fetched
+        # with one query per row
+        fields = ['id', 'title', 'publication_year', 'author']
+        read_only_fields = ['id']
     
-    def validate_title(self, value):
-        if len(value) < 3:
-            raise serializers.ValidationError("Title must be at least 3 characters long")
-        return value
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        keep = set(self.context.get('fields') or ()) & set(self.fields)
+        if keep:
+            for name in set(self.fields) - keep:
+                self.fields.pop(name)
     
     def validate_author(self, value):
         if value is None:
@@ -51,32 +62,48 @@ class AuthorSerializer(serializers.ModelSerializer):
     view of an author and all their associated books.
     
     Purpose:
-        - Validates incoming author data during creation/updates
+        - Validates incoming author data during creation/updates (name length
+          comes from the model field validator)
         - Converts Author model instances to JSON for API responses
-        - Includes nested book information using BookSerializer
+        - Includes nested book information as plain dicts
     
     Fields:
         - id: Auto-generated primary key
         - name: The author's name
-        - books: Nested list of all books written by this author (read-only)
+        - books: Nested list of the author's most recent books, capped at
+          BOOKS_LIMIT (read-only)
+        - books_count: Total number of books written by this author
+        - books_url: Book list endpoint filtered to this author, for paging
+          through the books beyond the nested ones
     
     Relationship Handling:
         The relationship between Author and Book is handled through a nested
         serializer approach:
         
-        1. **Nested Serialization**: The 'books' field uses BookSerializer with
-           `many=True` to serialize multiple related Book objects. This creates
-           a nested structure in the JSON response.
+        1. **Nested Serialization**: The 'books' field is a SerializerMethodField
+           that packs each related Book into a dict with the same keys
+           BookSerializer produces. Building the dicts by hand avoids
+           constructing a BookSerializer (and its bound fields) per book.
         
-        2. **Read-Only Books**: The `read_only=True` parameter ensures that:
+        2. **Read-Only Books**: SerializerMethodField is always read-only, so:
            - Books are included in GET responses (read operations)
            - Books cannot be created/updated directly through the Author endpoint
            - Book creation/updates must be done through the Book endpoint
         
         3. **Reverse Relationship**: Django automatically creates a reverse
            relationship from Author to Book through the ForeignKey. The serializer
-           accesses this via the 'books' field name, which Django REST Framework
-           automatically resolves from the Book model's ForeignKey.
+           accesses this via the 'books' field name, which matches the
+           related_name declared on the Book model's ForeignKey.
+        
+        4. **Eager Loading**: Serializing many authors would otherwise issue one
+           query per author for its books (N+1). Views pass their queryset
+           through setup_eager_loading(), which prefetches all books in a
+           single additional query, loading only the columns get_books() reads.
+        
+        5. **Bounded Fan-Out**: A prolific author would otherwise produce an
+           unbounded nested list. The prefetch is sliced to the BOOKS_LIMIT
+           most recent books per author (stored on 'books_head'), and the
+           total is exposed as books_count via an annotation.
         
         Example JSON Response:
         {
@@ -90,19 +117,71 @@ class AuthorSerializer(serializers.ModelSerializer):
                     "author": 1
                 },
                 ...
-            ]
+            ],
+            "books_count": 7,
+            "books_url": "/api/books/?author=1"
         }
     
     Usage:
         Used in API endpoints to serialize author data with nested book information
         for GET, POST, PUT, PATCH requests.
     """
-    books = BookSerializer(many=True, read_only=True)
+    BOOKS_LIMIT = 20
+    
+    books = serializers.SerializerMethodField()
+    books_count = serializers.SerializerMethodField()
+    books_url = serializers.SerializerMethodField()
     class Meta:
         model = Author
-        fields = ['id', 'name', 'books']
+        fields = ['id', 'name', 'books', 'books_count', 'books_url']
     
-    def validate_name(self, value):
-        if len(value) < 3:
-            raise serializers.ValidationError("Name must be at least 3 characters long")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Prefetches the author's first BOOKS_LIMIT books onto 'books_head' and
+        annotates books_count, so get_books() and get_books_count() read
+        from memory instead of querying per author. Both querysets load only
+        the columns this serializer reads.
+        """
+        books_head = (
+            Book.objects.only('id', 'title', 'publication_year', 'author_id')
+            .order_by('-publication_year', 'id')[:cls.BOOKS_LIMIT]
+        )
+        return (
+            queryset.only('id', 'name')
+            .annotate(books_count=Count('books'))
+            .prefetch_related(Prefetch('books', queryset=books_head, to_attr='books_head'))
+        )
+    
+    def get_books(self, obj):
+        """
+        Returns up to BOOKS_LIMIT of the author's books as a list of dicts.
+        
+        The dicts carry the BookSerializer fields but are built directly; no
+        BookSerializer/ListSerializer is constructed per author or per book.
+        
+        Reads the prefetched 'books_head' rows rather than calling .values()
+        so no query is issued per author; falls back to a sliced query when
+        the instance was not loaded through setup_eager_loading().
+        """
+        books = getattr(obj, 'books_head', None)
+        if books is None:
+            books = obj.books.order_by('-publication_year', 'id')[:self.BOOKS_LIMIT]
+        return [
+            {
+                'id': book.id,
+                'title': book.title,
+                'publication_year': book.publication_year,
+                'author': book.author_id,
+            }
+            for book in books
+        ]
+    
+    def get_books_count(self, obj):
+        """Returns the annotated book total, counting on demand if absent."""
+        count = getattr(obj, 'books_count', None)
+        return obj.books.count() if count is None else count
+    
+    def get_books_url(self, obj):
+        """Returns the book list URL filtered to this author."""
+        return f"{reverse('book-list')}?author={obj.pk}"
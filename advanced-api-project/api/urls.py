@@ -4,7 +4,10 @@ from . import views
 urlpatterns = [
     path('books/', views.ListView.as_view(), name='book-list'),
     path('books/<int:pk>/', views.DetailView.as_view(), name='book-detail'),
+    path('books/export/', views.ExportView.as_view(), name='book-export'),
     path('books/create/', views.CreateView.as_view(), name='create-book'),
+    path('books/bulk-create/', views.BulkCreateView.as_view(), name='bulk-create-books'),
     path('books/update/<int:pk>/', views.UpdateView.as_view(), name='update-book'),
     path('books/delete/<int:pk>/', views.DeleteView.as_view(), name='delete-book'),
+    path('authors/', views.AuthorListView.as_view(), name='author-list'),
 ]
\ No newline at end of file
@@ -1,32 +1,169 @@
+from calendar import timegm
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date
+from django.views.decorators.http import condition
 from django.shortcuts import render
-from rest_framework import generics
+from rest_framework import generics, status
+from rest_framework.response import Response
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Lower
+from .cache import LIST_CACHE_TIMEOUT, bump_list_cache_version, list_cache_key, list_etag
 from .models import Author, Book
+from .renderers import dumps
 from .serializers import AuthorSerializer, BookSerializer
 from rest_framework import permissions
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from rest_framework.serializers import ValidationError
-from django_filters.rest_framework import DjangoFilterBackend
-from django_filters import rest_framework as filters
-from rest_framework.filters import SearchFilter as DRFSearchFilter
-from rest_framework.filters import OrderingFilter as DRFOrderingFilter
-
-# Alias SearchFilter and OrderingFilter as filters.SearchFilter and filters.OrderingFilter for consistency
-filters.SearchFilter = DRFSearchFilter
-filters.OrderingFilter = DRFOrderingFilter
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, SearchFilter, OrderingFilter
 
 # Create your views here.
 
-# FilterSet class defined inline in views.py (not in separate file)
-class BookFilter(filters.FilterSet):
+class CachedListMixin:
+    """
+    Caches list() responses keyed by scheme, host, path and sorted query
+    parameters (the cached page carries absolute next/previous links).
+    
+    Cache hits skip the queryset, filtering, and serialization entirely.
+    Entries are invalidated whenever a Book or Author is saved or deleted
+    (see api/cache.py and the receivers in models.py).
+    
+    Responses carry an ETag derived from the same version and parameters,
+    so a client sending it back in If-None-Match gets a 304 Not Modified
+    with no body until the data changes. The ETag includes the negotiated
+    renderer and every response, 304s included, carries Vary: Accept.
+    """
+    cache_timeout = LIST_CACHE_TIMEOUT
+    
+    @method_decorator(condition(etag_func=list_etag))
+    def list(self, request, *args, **kwargs):
+        key = list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            cache.set(key, response.data, self.cache_timeout)
+            return response
+        return Response(data)
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+
+class EagerLoadingMixin:
+    """
+    Loads related objects only for the fields the client asked for.
+    
+    select_related_fields / prefetch_related_fields map serializer field names
+    to the relation that field reads. With ?fields=id,title only the relations
+    behind the requested fields are loaded; without ?fields= all of them are.
+    The requested names are also passed to the serializer in its context as
+    'fields', so it drops the fields that were not asked for.
+    """
+    select_related_fields = {}
+    prefetch_related_fields = {}
+    
+    def get_requested_fields(self):
+        """Returns the set of names in ?fields=, or None when it is absent."""
+        request = getattr(self, 'request', None)
+        fields = request.query_params.get('fields') if request is not None else None
+        if not fields:
+            return None
+        return {name.strip() for name in fields.split(',') if name.strip()}
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        requested = self.get_requested_fields()
+        select = [
+            relation for field, relation in self.select_related_fields.items()
+            if requested is None or field in requested
+        ]
+        prefetch = [
+            relation for field, relation in self.prefetch_related_fields.items()
+            if requested is None or field in requested
+        ]
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_requested_fields()
+        return context
+
+
+class ValuesListMixin:
+    """
+    Lists rows with QuerySet.values() instead of building model instances.
+    
+    Only for serializers whose output is exactly their model columns (no
+    SerializerMethodField, nested serializer or custom to_representation):
+    each serializer field is read as the column of the same name (a foreign
+    key as its id), so the row dicts already are the serialized form and no
+    model instance or per-row serializer call is needed. Filtering,
+    pagination and ?fields= work as in ListModelMixin.list().
+    """
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*self.get_serializer().fields)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(rows))
+
+
+def _db_lower(value):
+    """
+    Lowercases value with the database's LOWER(), the same function that
+    fills title_ci / name_ci, so both sides are folded identically (SQLite
+    folds ASCII only, where Python's str.lower would also fold 'É').
+    """
+    return Lower(Value(value))
+
+
+def _whole_number(value):
+    """
+    int() limited to the signed 64-bit range the database can compare
+    against; larger values would fail with OverflowError inside the query.
+    """
+    number = int(value)
+    if not -2**63 <= number < 2**63:
+        raise OverflowError(value)
+    return number
+
+
+def _author_ids_named(value):
     """
-    Book FilterSet
+    Subquery of the ids of authors whose name contains value (case-insensitive).
     
-    Defines filtering options for the Book model. This FilterSet allows users
-    to filter books by various attributes using different lookup expressions.
+    Matching the small Author table first and filtering books by
+    author_id IN (subquery) keeps the text scan off the book rows, and the
+    book side can use the author_id index instead of a JOIN.
+    """
+    return Author.objects.filter(name_ci__contains=_db_lower(value)).values('id')
+
+
+# Filter backend defined inline in views.py (not in separate file)
+class BookFilterBackend(BaseFilterBackend):
+    """
+    Book Filter Backend
+    
+    Filters books by query parameters through a fixed table mapping each
+    parameter to an ORM lookup and a value converter. The table is built
+    once at import, so a request only reads the parameters it names and
+    makes a single filter() call, without building and validating the
+    per-request Form that django-filter's FilterSet uses.
     
-    Filter Fields:
-        - title: Filter by book title (case-insensitive exact match)
+    Filter Parameters:
+        - title: Filter by book title (exact, case-sensitive match; uses the title index)
+        - title__iexact: Filter by book title (case-insensitive exact match, opt-in)
         - title__icontains: Filter by book title (case-insensitive partial match)
         - publication_year: Filter by exact publication year
         - publication_year__gte: Filter books published in or after this year
@@ -35,6 +172,13 @@ class BookFilter(filters.FilterSet):
         - author__name: Filter by author name (case-insensitive partial match)
         - author__name__iexact: Filter by author name (case-insensitive exact match)
     
+    Case-insensitive filters lowercase the value with the database's LOWER()
+    and compare it against the lowercased title_ci / author.name_ci columns.
+    The exact matches (title__iexact, author__name__iexact) can use the
+    indexes on those columns; the partial matches are a LIKE '%...%' and
+    still scan. Empty parameters are ignored; a year or author id that is
+    not an integer, or does not fit in 64 bits, is rejected with 400.
+    
     Usage Examples:
         - /api/books/?title=Harry Potter
         - /api/books/?publication_year=1997
@@ -42,21 +186,38 @@ class BookFilter(filters.FilterSet):
         - /api/books/?author__name=Rowling
         - /api/books/?title__icontains=potter&publication_year__gte=1997
     """
-    title = filters.CharFilter(lookup_expr='iexact', help_text="Filter by exact book title (case-insensitive)")
-    title__icontains = filters.CharFilter(field_name='title', lookup_expr='icontains', help_text="Filter by book title containing text (case-insensitive)")
-    publication_year = filters.NumberFilter(lookup_expr='exact', help_text="Filter by exact publication year")
-    publication_year__gte = filters.NumberFilter(field_name='publication_year', lookup_expr='gte', help_text="Filter books published in or after this year")
-    publication_year__lte = filters.NumberFilter(field_name='publication_year', lookup_expr='lte', help_text="Filter books published in or before this year")
-    author = filters.NumberFilter(lookup_expr='exact', help_text="Filter by author ID")
-    author__name = filters.CharFilter(field_name='author__name', lookup_expr='icontains', help_text="Filter by author name containing text (case-insensitive)")
-    author__name__iexact = filters.CharFilter(field_name='author__name', lookup_expr='iexact', help_text="Filter by exact author name (case-insensitive)")
-    
-    class Meta:
-        model = Book
-        fields = ['title', 'publication_year', 'author']
+    # query parameter -> (ORM lookup, converter applied to the raw value)
+    FILTERS = {
+        'title': ('title', str),
+        'title__iexact': ('title_ci', _db_lower),
+        'title__icontains': ('title_ci__contains', _db_lower),
+        'publication_year': ('publication_year', _whole_number),
+        'publication_year__gte': ('publication_year__gte', _whole_number),
+        'publication_year__lte': ('publication_year__lte', _whole_number),
+        'author': ('author_id', _whole_number),
+        'author__name': ('author_id__in', _author_ids_named),
+        'author__name__iexact': ('author__name_ci', _db_lower),
+    }
+    
+    def filter_queryset(self, request, queryset, view):
+        lookups = {}
+        errors = {}
+        for param, (lookup, convert) in self.FILTERS.items():
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            try:
+                lookups[lookup] = convert(value)
+            except ValueError:
+                errors[param] = ['Enter a whole number.']
+            except OverflowError:
+                errors[param] = ['Ensure this value fits in a 64-bit integer.']
+        if errors:
+            raise ValidationError(errors)
+        return queryset.filter(**lookups) if lookups else queryset
 
 
-class ListView(generics.ListAPIView):
+class ListView(CachedListMixin, ValuesListMixin, EagerLoadingMixin, generics.ListAPIView):
     """
     Book List View
     
@@ -65,21 +226,22 @@ class ListView(generics.ListAPIView):
     
     Configuration:
         - View Type: ListAPIView (handles GET requests for collections)
-        - Queryset: Returns all Book objects from the database
-        - Serializer: Uses BookSerializer to format response data
+        - Queryset: Returns all Book objects, read as value dicts (ValuesListMixin)
+        - Serializer: BookSerializer defines the response fields
         - Permissions: IsAuthenticatedOrReadOnly - allows GET without authentication,
           requires authentication for write operations
     
     Intended Operation:
         - Accepts GET requests to retrieve a list of books
         - Supports filtering, searching, and ordering via query parameters
-        - Returns a JSON array of book objects
+        - Returns a page of book objects (LimitOffsetPagination, see settings)
         - Public read access (no authentication required for GET)
         - Does not support POST, PUT, PATCH, or DELETE operations
     
     Filtering Capabilities:
-        Uses DjangoFilterBackend with BookFilter for advanced filtering:
-        - title: Exact match on book title (case-insensitive)
+        Uses BookFilterBackend for advanced filtering:
+        - title: Exact match on book title (case-sensitive)
+        - title__iexact: Exact match on book title (case-insensitive)
         - title__icontains: Partial match on book title (case-insensitive)
         - publication_year: Exact match on publication year
         - publication_year__gte: Books published in or after this year
@@ -109,11 +271,18 @@ class ListView(generics.ListAPIView):
     
     Custom Settings:
         - permission_classes: IsAuthenticatedOrReadOnly for flexible access control
-        - filter_backends: DjangoFilterBackend, SearchFilter, OrderingFilter
-        - filterset_class: BookFilter for advanced filtering options
+        - filter_backends: BookFilterBackend, SearchFilter, OrderingFilter
         - search_fields: ['title', 'author__name'] for text search
         - ordering_fields: ['title', 'publication_year', 'author__name', 'id']
         - ordering: Default ordering (by id ascending)
+        - CachedListMixin: responses are cached per filter/search/ordering
+          combination and invalidated on any Book or Author change
+        - EagerLoadingMixin: ?fields=id,title limits the response to the
+          listed fields
+        - ValuesListMixin: selects only the BookSerializer columns with
+          values() and returns the row dicts as they are, without building
+          Book instances; the author is returned as author_id, so it is not
+          joined (except to search or order by author name)
     
     URL Pattern: /api/books/
     HTTP Methods: GET
@@ -123,10 +292,8 @@ class ListView(generics.ListAPIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
     
     # Filter backends: enables filtering, searching, and ordering
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    
-    # Advanced filtering using FilterSet (defined inline above)
-    filterset_class = BookFilter
+    # (BookFilterBackend is defined inline above)
+    filter_backends = [BookFilterBackend, SearchFilter, OrderingFilter]
     
     # Search fields: performs case-insensitive text search
     search_fields = ['title', 'author__name']
@@ -137,7 +304,7 @@ class ListView(generics.ListAPIView):
     # Default ordering (if no ordering parameter is provided)
     ordering = ['id']
 
-class DetailView(generics.RetrieveAPIView):
+class DetailView(EagerLoadingMixin, generics.RetrieveAPIView):
     """
     Book Detail View
     
@@ -163,6 +330,10 @@ class DetailView(generics.RetrieveAPIView):
     
     Custom Settings:
         - permission_classes: IsAuthenticatedOrReadOnly for flexible access control
+        - EagerLoadingMixin: ?fields=id,title limits the response to the
+          listed fields; the author is joined only when 'author' is returned
+        - retrieve(): sends Last-Modified (the book's updated_at) and answers
+          a matching If-Modified-Since with 304 Not Modified
     
     URL Pattern: /api/books/<int:pk>/
     HTTP Methods: GET
@@ -170,6 +341,71 @@ class DetailView(generics.RetrieveAPIView):
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    
+    # Join the author (select_related) unless ?fields= leaves it out
+    select_related_fields = {'author': 'author'}
+    
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns the book, or 304 Not Modified when the client's
+        If-Modified-Since is not older than the book's updated_at.
+        
+        The check runs after the single lookup query and before
+        serialization; every 200 response carries a Last-Modified header.
+        """
+        instance = self.get_object()
+        last_modified = timegm(instance.updated_at.utctimetuple())
+        not_modified = get_conditional_response(request, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+        response = Response(self.get_serializer(instance).data)
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+class ExportView(generics.GenericAPIView):
+    """
+    Book Export View
+    
+    Streams every book (optionally narrowed with the BookFilterBackend parameters)
+    as a single unpaginated JSON array.
+    
+    Configuration:
+        - View Type: GenericAPIView with a custom get()
+        - Queryset: Book rows limited to the serialized columns, ordered by id
+        - Serializer: BookSerializer (one instance reused for every row)
+        - Permissions: IsAuthenticatedOrReadOnly - allows GET without authentication
+    
+    Intended Operation:
+        - Reads the queryset with iterator(chunk_size=EXPORT_CHUNK_SIZE), so rows
+          are fetched in chunks and never cached on the queryset
+        - Returns a StreamingHttpResponse that writes each book as it is
+          serialized, so memory stays bounded by the chunk size and the
+          client receives the first bytes before the last rows are read
+    
+    URL Pattern: /api/books/export/
+    HTTP Methods: GET
+    """
+    EXPORT_CHUNK_SIZE = 2000
+    
+    queryset = Book.objects.only('id', 'title', 'publication_year', 'author_id').order_by('id')
+    serializer_class = BookSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    filter_backends = [BookFilterBackend]
+    
+    def get(self, request, *args, **kwargs):
+        books = self.filter_queryset(self.get_queryset()).iterator(chunk_size=self.EXPORT_CHUNK_SIZE)
+        return StreamingHttpResponse(self.stream_books(books), content_type='application/json')
+    
+    def stream_books(self, books):
+        """Yields the JSON array one serialized book at a time."""
+        serializer = self.get_serializer()
+        yield b'['
+        for index, book in enumerate(books):
+            if index:
+                yield b','
+            yield dumps(serializer.to_representation(book))
+        yield b']'
+
 
 class CreateView(generics.CreateAPIView):
     """
@@ -196,11 +432,8 @@ class CreateView(generics.CreateAPIView):
            - This hook is called after validation but before saving
            - Note: This assumes request.user is an Author instance or compatible
         
-        2. **create()**: Overrides the default create method to add custom validation
-           - Performs additional validation check for 'title' field
-           - Raises ValidationError if title is missing
-           - This runs before perform_create() and serializer validation
-           - Extends default behavior by adding explicit title requirement check
+        A missing 'title' is rejected by BookSerializer validation (the model
+        field is required), so the request body is parsed only once.
     
     Authentication Requirements:
         - Request must include: Authorization: Token <token_value>
@@ -227,21 +460,54 @@ class CreateView(generics.CreateAPIView):
         """
         serializer.save(author=self.request.user)
 
-    def create(self, request, *args, **kwargs):
-        """
-        Overrides the default create method to add custom validation.
-        
-        Custom Behavior:
-            - Checks if 'title' field is present in request data
-            - Raises ValidationError if title is missing
-            - This validation happens before serializer validation
-        
-        This extends the default create behavior by adding an explicit
-        title requirement check at the view level.
-        """
-        if request.data.get('title') is None:
-            raise ValidationError("Title is required")
-        return super().create(request, *args, **kwargs)
+
+class BulkCreateView(generics.GenericAPIView):
+    """
+    Bulk Create Book View
+    
+    Provides authenticated access to create many books in one request.
+    
+    Configuration:
+        - View Type: GenericAPIView with a custom post()
+        - Serializer: BookSerializer with many=True (validates every item)
+        - Authentication: TokenAuthentication - requires a valid token in request headers
+        - Permissions: IsAuthenticated - user must be logged in
+    
+    Intended Operation:
+        - Accepts a JSON array of up to MAX_BOOKS book objects (same fields as
+          CreateView); a longer array is rejected with HTTP 400 before any
+          item is validated
+        - Validates all items first; if any item is invalid, nothing is
+          created and HTTP 400 lists the errors per item
+        - Inserts the books with bulk_create() in batches of
+          BULK_CREATE_BATCH_SIZE inside one transaction
+        - Returns the created books with HTTP 201 status
+    
+    Note:
+        bulk_create() does not send post_save signals, so the view bumps the
+        list cache version itself (see api/cache.py).
+    
+    URL Pattern: /api/books/bulk-create/
+    HTTP Methods: POST
+    """
+    BULK_CREATE_BATCH_SIZE = 1000
+    MAX_BOOKS = 1000
+    
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True, max_length=self.MAX_BOOKS)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            books = Book.objects.bulk_create(
+                [Book(**item) for item in serializer.validated_data],
+                batch_size=self.BULK_CREATE_BATCH_SIZE,
+            )
+        bump_list_cache_version()
+        return Response(self.get_serializer(books, many=True).data, status=status.HTTP_201_CREATED)
 
 
 class UpdateView(generics.UpdateAPIView):
@@ -270,17 +536,14 @@ class UpdateView(generics.UpdateAPIView):
            - Ensures the author field is always updated to the current user
            - Note: This assumes request.user is an Author instance or compatible
         
-        2. **update()**: Overrides the default update method to add custom validation
-           - Performs additional validation check for 'title' field
-           - Raises ValidationError if title is missing
-           - This runs before perform_update() and serializer validation
-           - Extends default behavior by adding explicit title requirement check
+        BookSerializer requires 'title' on PUT; PATCH may omit it like any
+        other field of a partial update.
     
     Authentication Requirements:
         - Request must include: Authorization: Token <token_value>
         - Token must be valid and associated with an authenticated user
     
-    URL Pattern: /api/books/<int:pk>/update/
+    URL Pattern: /api/books/update/<int:pk>/
     HTTP Methods: PUT, PATCH
     """
     queryset = Book.objects.all()
@@ -301,22 +564,6 @@ class UpdateView(generics.UpdateAPIView):
         """
         serializer.save(author=self.request.user)
 
-    def update(self, request, *args, **kwargs):
-        """
-        Overrides the default update method to add custom validation.
-        
-        Custom Behavior:
-            - Checks if 'title' field is present in request data
-            - Raises ValidationError if title is missing
-            - This validation happens before serializer validation
-        
-        This extends the default update behavior by adding an explicit
-        title requirement check at the view level.
-        """
-        if request.data.get('title') is None:
-            raise ValidationError("Title is required")
-        return super().update(request, *args, **kwargs)
-
 
 class DeleteView(generics.DestroyAPIView):
     """
@@ -329,7 +576,7 @@ class DeleteView(generics.DestroyAPIView):
         - Queryset: Book.objects.all() (filtered by pk in URL)
         - Serializer: Uses BookSerializer (for response formatting if needed)
         - Permissions: IsAuthenticated - user must be logged in
-        - Authentication: Uses default authentication (inherits from settings)
+        - Authentication: TokenAuthentication (like the create and update views)
     
     Intended Operation:
         - Accepts DELETE requests for a book identified by primary key
@@ -338,18 +585,51 @@ class DeleteView(generics.DestroyAPIView):
         - Returns HTTP 404 if book doesn't exist
     
     Custom Settings:
+        - authentication_classes: Set to [TokenAuthentication]; its WWW-Authenticate
+          header makes a request without credentials get 401, as on the other
+          write endpoints
         - permission_classes: Set to [IsAuthenticated] to require user authentication
-          Note: This view does not explicitly set authentication_classes, so it will
-          use the default authentication method configured in Django REST Framework
-          settings (typically SessionAuthentication)
     
     Authentication Requirements:
-        - User must be authenticated (via default authentication method)
-        - For TokenAuthentication, request must include: Authorization: Token <token_value>
+        - Request must include: Authorization: Token <token_value>
+        - Token must be valid and associated with an authenticated user
     
-    URL Pattern: /api/books/<int:pk>/delete/
+    URL Pattern: /api/books/delete/<int:pk>/
     HTTP Methods: DELETE
     """
     queryset = Book.objects.all()
     serializer_class = BookSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+
+class AuthorListView(CachedListMixin, generics.ListAPIView):
+    """
+    Author List View
+    
+    Provides read-only access to list all authors together with their
+    nested books.
+    
+    Configuration:
+        - View Type: ListAPIView (handles GET requests for collections)
+        - Queryset: Returns all Author objects with their books prefetched
+        - Serializer: Uses AuthorSerializer (nested 'books' field)
+        - Permissions: IsAuthenticatedOrReadOnly - allows GET without authentication
+    
+    Custom Hooks:
+        - CachedListMixin: responses are cached and invalidated on any Book
+          or Author change
+        - get_queryset(): Passes the queryset through
+          AuthorSerializer.setup_eager_loading() so the nested books of every
+          author are loaded in one extra query instead of one per author.
+    
+    URL Pattern: /api/authors/
+    HTTP Methods: GET
+    """
+    queryset = Author.objects.all()
+    serializer_class = AuthorSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    
+    def get_queryset(self):
+        """Returns the author queryset with the 'books' relation prefetched."""
+        return AuthorSerializer.setup_eager_loading(super().get_queryset())
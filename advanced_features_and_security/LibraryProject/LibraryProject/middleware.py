@@ -10,10 +10,26 @@ This prevents malicious scripts from being injected and executed.
 For more information: https://developer.mozilla.org/en-US/docs/Web/HTTP/CSP
 """
 
-from django.utils.deprecation import MiddlewareMixin
+# The policy is the same for every response, so it is assembled once at import.
+# 'self' means same origin, 'unsafe-inline' allows inline scripts/styles
+# Note: 'unsafe-inline' is needed for Django admin and some templates
+# In production, consider using nonces or hashes instead
+CSP_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "  # unsafe-eval needed for admin
+    "style-src 'self' 'unsafe-inline'; "  # Allows inline styles
+    "img-src 'self' data: https:; "  # Allows images from same origin, data URIs, and HTTPS
+    "font-src 'self' data:; "  # Allows fonts from same origin and data URIs
+    "connect-src 'self'; "  # Restricts AJAX/fetch to same origin
+    "frame-ancestors 'none'; "  # Prevents embedding in iframes (clickjacking protection)
+    "base-uri 'self'; "  # Restricts base tag URLs
+    "form-action 'self'; "  # Restricts form submissions to same origin
+    "object-src 'none'; "  # Prevents plugins (Flash, etc.)
+    "upgrade-insecure-requests"  # Upgrades HTTP to HTTPS automatically
+)
 
 
-class CSPMiddleware(MiddlewareMixin):
+class CSPMiddleware:
     """
     Content Security Policy Middleware
     
@@ -24,13 +40,19 @@ class CSPMiddleware(MiddlewareMixin):
     - Prevents inline script execution (XSS protection)
     - Restricts resource loading to trusted sources only
     - Provides defense-in-depth against code injection attacks
+    
+    Written as a plain callable middleware (__init__ + __call__) rather than
+    through MiddlewareMixin, so each request goes through one call.
     """
     
-    def process_response(self, request, response):
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
         """
         Add CSP headers to the response.
         
-        CSP Directives Explained:
+        CSP Directives Explained (see CSP_POLICY):
         - default-src: Fallback for other fetch directives
         - script-src: Controls which scripts can be executed
         - style-src: Controls which stylesheets can be applied
@@ -40,31 +62,21 @@ class CSPMiddleware(MiddlewareMixin):
         - frame-ancestors: Prevents clickjacking (replaces X-Frame-Options)
         - base-uri: Restricts which URLs can be used as base
         - form-action: Restricts which URLs can be used as form action
+        
+        The header is skipped on 304 Not Modified responses (the browser
+        reuses the cached response and its headers) and when a view has
+        already set its own policy.
         """
+        response = self.get_response(request)
         
-        # Build CSP header value
-        # 'self' means same origin, 'unsafe-inline' allows inline scripts/styles
-        # Note: 'unsafe-inline' is needed for Django admin and some templates
-        # In production, consider using nonces or hashes instead
-        csp_policy = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "  # unsafe-eval needed for admin
-            "style-src 'self' 'unsafe-inline'; "  # Allows inline styles
-            "img-src 'self' data: https:; "  # Allows images from same origin, data URIs, and HTTPS
-            "font-src 'self' data:; "  # Allows fonts from same origin and data URIs
-            "connect-src 'self'; "  # Restricts AJAX/fetch to same origin
-            "frame-ancestors 'none'; "  # Prevents embedding in iframes (clickjacking protection)
-            "base-uri 'self'; "  # Restricts base tag URLs
-            "form-action 'self'; "  # Restricts form submissions to same origin
-            "object-src 'none'; "  # Prevents plugins (Flash, etc.)
-            "upgrade-insecure-requests"  # Upgrades HTTP to HTTPS automatically
-        )
+        if response.status_code == 304 or 'Content-Security-Policy' in response:
+            return response
         
         # Set the CSP header
-        response['Content-Security-Policy'] = csp_policy
+        response['Content-Security-Policy'] = CSP_POLICY
         
         # Also set report-only version for testing (optional)
         # Uncomment to test CSP without blocking resources
-        # response['Content-Security-Policy-Report-Only'] = csp_policy
+        # response['Content-Security-Policy-Report-Only'] = CSP_POLICY
         
         return response
@@ -229,4 +229,7 @@ LOGOUT_REDIRECT_URL = '/relationship_app/login/'
 # AUTH_USER_MODEL = 'relationship_app.UserProfile'
 AUTH_USER_MODEL = 'relationship_app.CustomUser'
 AUTH_USER_MODEL = 'bookshelf.CustomUser'
+# Same checks as ModelBackend, with a user's permissions loaded in one query
+# and kept for the rest of the request
+AUTHENTICATION_BACKENDS = ['bookshelf.backends.CachedPermissionBackend']
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
@@ -0,0 +1,20 @@
+"""
+Test settings for LibraryProject.
+
+Extends the regular settings with overrides that only make sense for the
+test suite:
+- MD5PasswordHasher: the default PBKDF2 hasher runs hundreds of thousands of
+  iterations per create_user()/login()/check_password(); test passwords never
+  leave the test database, so a single cheap hash is enough.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=LibraryProject.test_settings python manage.py test relationship_app
+
+    # Run in parallel and reuse the test database between runs
+    DJANGO_SETTINGS_MODULE=LibraryProject.test_settings python manage.py test relationship_app --parallel=auto --keepdb
+"""
+from .settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
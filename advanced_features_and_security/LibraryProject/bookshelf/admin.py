@@ -1,12 +1,19 @@
 from django.contrib import admin
+from django.db import models
 
 # Register your models here.
-from .models import Book
+from .models import Author, Book
 from django.contrib.auth.admin import UserAdmin
 from .models import CustomUser
 
 
 
+@admin.register(Author)
+class AuthorAdmin(admin.ModelAdmin):
+    # Backs the author autocomplete on BookAdmin
+    search_fields = ('name',)
+
+
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
     # Fields displayed in the list view
@@ -15,14 +22,42 @@ class BookAdmin(admin.ModelAdmin):
     # Sidebar filters
     list_filter = ('author', 'publication_year')
 
-    # Search bar fields
-    search_fields = ('title', 'author')
+    # Search bar fields: titles starting with the term (istartswith) or an
+    # exact author name, instead of '%term%' matches over both columns. This
+    # narrows what the search matches; it is not index-backed (SQLite's
+    # LIKE ... ESCAPE does not use a b-tree index)
+    search_fields = ('^title', '=author__name')
+
+    # Join the author into the changelist query; list_display shows it per row
+    list_select_related = ('author',)
+
+    # Pick the author through an AJAX search instead of a <select> holding
+    # every Author row
+    autocomplete_fields = ('author',)
+
+    # Only the title links to the change form
+    list_display_links = ('title',)
+
+    # Skip the extra unfiltered COUNT(*) on filtered/searched changelists
+    show_full_result_count = False
 
+    # Rows per changelist page
+    list_per_page = 50
 
 
 
 
+
+# Extra CustomUser fields, shown on both the change and the add form
+ADDITIONAL_INFORMATION_FIELDSETS = (
+    ('Additional Information', {
+        'fields': ('date_of_birth', 'profile_picture'),
+    }),
+)
+
+
 class CustomUserAdmin(UserAdmin):
+    # Shared with relationship_app, which registers its own CustomUser with it
     model = CustomUser
 
     list_display = (
@@ -35,17 +70,19 @@ class CustomUserAdmin(UserAdmin):
         'is_active',
     )
 
-    fieldsets = UserAdmin.fieldsets + (
-        ('Additional Information', {
-            'fields': ('date_of_birth', 'profile_picture'),
-        }),
-    )
+    fieldsets = UserAdmin.fieldsets + ADDITIONAL_INFORMATION_FIELDSETS
 
-    add_fieldsets = UserAdmin.add_fieldsets + (
-        ('Additional Information', {
-            'fields': ('date_of_birth', 'profile_picture'),
-        }),
-    )
+    add_fieldsets = UserAdmin.add_fieldsets + ADDITIONAL_INFORMATION_FIELDSETS
+
+    def get_queryset(self, request):
+        # list_display shows no image, so leave the image file columns
+        # (profile_photo / profile_picture, depending on the app's model) out
+        # of the changelist query; the change form loads them on access
+        image_fields = [
+            field.name for field in self.model._meta.concrete_fields
+            if isinstance(field, models.FileField)
+        ]
+        return super().get_queryset(request).defer(*image_fields)
 
 
 admin.site.register(CustomUser, CustomUserAdmin)
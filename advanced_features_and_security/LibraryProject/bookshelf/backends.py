@@ -0,0 +1,36 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Permission
+from django.db.models import Q
+
+from .models import CustomUser
+
+
+class CachedPermissionBackend(ModelBackend):
+    """
+    ModelBackend that loads a user's permissions with a single query
+
+    ModelBackend reads user and group permissions with two queries on the
+    first has_perm() of a request. Here both come from one query, and the
+    set is kept on the user object (_perm_cache) as ModelBackend does.
+    request.user is loaded again for every request, so nothing is shared
+    between requests or processes and a revoked permission applies to the
+    next request.
+    """
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if not hasattr(user_obj, '_perm_cache'):
+            if user_obj.is_superuser:
+                perms = Permission.objects.all()
+            else:
+                # Read the membership tables directly: the reverse query names
+                # of groups/user_permissions are shared with
+                # relationship_app.CustomUser and resolve to its tables
+                group_ids = CustomUser.groups.through.objects.filter(customuser_id=user_obj.pk).values('group_id')
+                perm_ids = CustomUser.user_permissions.through.objects.filter(customuser_id=user_obj.pk).values('permission_id')
+                perms = Permission.objects.filter(Q(group__in=group_ids) | Q(pk__in=perm_ids))
+            user_obj._perm_cache = {
+                f'{app_label}.{codename}'
+                for app_label, codename in perms.values_list('content_type__app_label', 'codename').order_by()
+            }
+        return user_obj._perm_cache
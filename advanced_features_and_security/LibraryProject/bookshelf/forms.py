@@ -10,6 +10,26 @@ SECURITY NOTES:
 from django import forms
 from .models import Book, Author
 
+# SECURITY: Characters rejected in free-text fields (HTML tag delimiters)
+HTML_TAG_CHARS = frozenset('<>')
+
+
+class AuthorChoiceIterator(forms.models.ModelChoiceIterator):
+    """
+    Yields the author <option>s as (id, name) rows streamed in chunks
+    
+    Avoids building an Author instance per option; submitted values are
+    still validated against the field's queryset.
+    """
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        yield from self.queryset.values_list('id', 'name').iterator(chunk_size=2000)
+
+
+class AuthorChoiceField(forms.ModelChoiceField):
+    iterator = AuthorChoiceIterator
+
 
 class BookForm(forms.ModelForm):
     """
@@ -28,7 +48,7 @@ class BookForm(forms.ModelForm):
         widget=forms.TextInput(attrs={'class': 'form-control'}),
         help_text='Enter the book title (max 100 characters)'
     )
-    author = forms.ModelChoiceField(
+    author = AuthorChoiceField(
         queryset=Author.objects.all(),
         required=True,
         empty_label='Select an author',
@@ -39,6 +59,12 @@ class BookForm(forms.ModelForm):
         model = Book
         fields = ['title', 'author']
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Options are rendered from (id, name) rows (AuthorChoiceIterator);
+        # a fresh queryset per form so the choices never go stale
+        self.fields['author'].queryset = Author.objects.only('id', 'name').order_by('name')
+    
     def clean_title(self):
         """
         Validate and sanitize book title
@@ -57,7 +83,7 @@ class BookForm(forms.ModelForm):
                 raise forms.ValidationError('Title cannot be empty or only whitespace.')
             # SECURITY: Block HTML tags to prevent XSS attacks
             # Note: Django templates auto-escape, but this adds defense-in-depth
-            if '<' in title or '>' in title:
+            if not HTML_TAG_CHARS.isdisjoint(title):
                 raise forms.ValidationError('Title contains invalid characters.')
         return title
     
@@ -118,7 +144,7 @@ class ExampleForm(forms.Form):
             name = name.strip()
             if not name:
                 raise forms.ValidationError('Name cannot be empty or only whitespace.')
-            if '<' in name or '>' in name:
+            if not HTML_TAG_CHARS.isdisjoint(name):
                 raise forms.ValidationError('Name contains invalid characters.')
         return name
     
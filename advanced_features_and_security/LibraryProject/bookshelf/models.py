@@ -1,7 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
@@ -33,6 +34,36 @@ class CustomUserManager(BaseUserManager):
 
         return self.create_user(username, password, **extra_fields)
 
+    def bulk_create_users(self, rows, batch_size=None):
+        """
+        Creates users from dicts of create_user() arguments in a few queries.
+
+        For batch imports: bulk_create() sends no post_save, so the profiles
+        and groups create_user_profile would add are bulk-created here too.
+        """
+        users = []
+        for row in rows:
+            row = dict(row)
+            password = row.pop('password', None)
+            user = self.model(username=self.model.normalize_username(row.pop('username')), **row)
+            user.set_password(password)
+            users.append(user)
+        with transaction.atomic(using=self._db):
+            users = self.bulk_create(users, batch_size=batch_size)
+            profiles = UserProfile.objects.using(self._db).bulk_create(
+                [UserProfile(user=user) for user in users], batch_size=batch_size
+            )
+            # Written through the groups table directly: Group.user_set is
+            # shared with relationship_app.CustomUser and resolves to that model
+            groups = {role: list(role_groups(role)) for role in {profile.role for profile in profiles}}
+            Membership = self.model.groups.through
+            Membership.objects.using(self._db).bulk_create([
+                Membership(customuser_id=profile.user_id, group_id=group.pk)
+                for profile in profiles
+                for group in groups[profile.role]
+            ], batch_size=batch_size)
+        return users
+
 
 
 class CustomUser(AbstractUser):
@@ -48,7 +79,8 @@ class Author(models.Model):
         return self.name
 
 class Book(models.Model):
-    title = models.CharField(max_length=100)
+    # Indexed for the admin title search/ordering; author_id is indexed as a FK
+    title = models.CharField(max_length=100, db_index=True)
     author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='books')
 
     def __str__(self):
@@ -103,32 +135,38 @@ class UserProfile(models.Model):
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_profile(sender, instance, created, **kwargs):
+    # The only user post_save handler: a new user gets its profile and role
+    # group here, and saving an existing user touches neither
     if created:
-        UserProfile.objects.create(user=instance)
+        profile = UserProfile.objects.create(user=instance)
+        assign_group(instance, profile.role)
 
 
-@receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def save_user_profile(sender, instance, **kwargs):
-    instance.profile.save()
+def role_groups(role):
+    """Returns the groups of a new user with the given role."""
+    if role == 'Editors':
+        perms = ['can_view', 'can_create', 'can_edit']
+    elif role == 'Admin':
+        perms = ['can_view', 'can_create', 'can_edit', 'can_delete']
+    else:
+        # Viewers, and any other role
+        perms = ['can_view']
 
+    return Group.objects.filter(name__in=perms)
 
 
-@receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def assign_group(sender, instance, created, **kwargs):
-    if created:
-        role = instance.profile.role
-        group, created_group = Group.objects.get_or_create(name=role)
-
-        if created_group:
-            content_type = ContentType.objects.get_for_model(Book)
-
-            if role == 'Editors':
-                perms = ['can_view', 'can_create', 'can_edit']
-            elif role == 'Viewers':
-                perms = ['can_view']
-            elif role == 'Admin':
-                perms = ['can_view', 'can_create', 'can_edit', 'can_delete']
-            else:
-                perms = ['can_view']
-
-        instance.groups.set(Group.objects.filter(name__in=perms))
+def assign_group(instance, role):
+    """Assigns the groups of a new user with the given role."""
+    instance.groups.set(role_groups(role))
+
+
+# Cached book list rendered by views.book_list; dropped on any change to the
+# books or authors it shows
+BOOK_LIST_CACHE_KEY = 'bookshelf:book_list'
+BOOK_LIST_CACHE_TIMEOUT = 60 * 5
+
+
+@receiver([post_save, post_delete], sender=Book)
+@receiver([post_save, post_delete], sender=Author)
+def invalidate_book_list(sender, **kwargs):
+    cache.delete(BOOK_LIST_CACHE_KEY)
@@ -1,3 +1,85 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .models import Book, UserProfile
+
+User = get_user_model()
+
+
+class BulkCreateUsersTests(TestCase):
+    """Test CustomUserManager.bulk_create_users"""
+
+    # SAVEPOINT, user INSERT, profile INSERT, groups SELECT, group membership
+    # INSERT, RELEASE SAVEPOINT
+    BULK_CREATE_QUERIES = 6
+
+    @classmethod
+    def setUpTestData(cls):
+        # New profiles have no role (''), so imported users join 'can_view'
+        cls.can_view = Group.objects.create(name='can_view')
+
+    def test_bulk_create_users_constant_queries(self):
+        """Test that importing users costs the same queries for any number of rows"""
+        for count in (1, 5):
+            rows = [
+                {'username': f'import{count}_{i}', 'password': 'testpass123', 'email': f'import{count}_{i}@example.com'}
+                for i in range(count)
+            ]
+            with self.subTest(count=count), self.assertNumQueries(self.BULK_CREATE_QUERIES):
+                User.objects.bulk_create_users(rows)
+
+    def test_bulk_create_users_creates_profiles_and_groups(self):
+        """Test that imported users get a password, a profile and their role groups"""
+        users = User.objects.bulk_create_users([
+            {'username': 'import1', 'password': 'testpass123'},
+            {'username': 'import2', 'password': 'testpass123'},
+        ])
+
+        self.assertEqual(User.objects.filter(username__in=['import1', 'import2']).count(), 2)
+        self.assertEqual(UserProfile.objects.filter(user__in=users).count(), 2)
+        self.assertEqual(set(User.objects.filter(groups=self.can_view)), set(users))
+        self.assertTrue(User.objects.get(username='import1').check_password('testpass123'))
+
+
+class CachedPermissionBackendTests(TestCase):
+    """Test bookshelf.backends.CachedPermissionBackend"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.can_view = Permission.objects.get(
+            codename='can_view', content_type=ContentType.objects.get_for_model(Book)
+        )
+        cls.viewers = Group.objects.create(name='Viewers')
+        cls.viewers.permissions.add(cls.can_view)
+        cls.user = User.objects.create(username='viewer')
+        cls.user.groups.add(cls.viewers)
+
+    def test_permissions_loaded_in_one_query(self):
+        """Test that the first permission check costs one query and later ones none"""
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertTrue(user.has_perm('bookshelf.can_view'))
+            self.assertFalse(user.has_perm('bookshelf.can_delete'))
+
+    def test_revoked_group_permission_denied_on_next_request(self):
+        """Test that removing a permission from a group applies to the next request"""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('list_books'), secure=True)
+        self.assertEqual(response.status_code, 200)
+
+        self.viewers.permissions.remove(self.can_view)
+
+        response = self.client.get(reverse('list_books'), secure=True)
+        self.assertEqual(response.status_code, 403)
+
+    def test_removed_from_group_denied_on_next_request(self):
+        """Test that leaving a group applies to the next request"""
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(reverse('list_books'), secure=True).status_code, 200)
+
+        self.user.groups.remove(self.viewers)
+
+        self.assertEqual(self.client.get(reverse('list_books'), secure=True).status_code, 403)
@@ -1,5 +1,6 @@
 from django.shortcuts import render, get_object_or_404
-from .models import Book, Author
+from django.core.cache import cache
+from .models import Book, Author, BOOK_LIST_CACHE_KEY, BOOK_LIST_CACHE_TIMEOUT
 from .models import Library
 from django.http import HttpResponse
 from django.views.generic import ListView
@@ -23,7 +24,15 @@ from django.contrib.auth.backends import BaseBackend
 # Create your views here.
 @permission_required('bookshelf.can_view', raise_exception=True)
 def book_list(request):
-    books = Book.objects.all()
+    # The template prints book.author.name for every book: join the author
+    # into the same query and load only the columns the template reads.
+    # The list is cached (invalidated by the receivers in models.py); the
+    # permission check above still runs on every request
+    books = cache.get_or_set(
+        BOOK_LIST_CACHE_KEY,
+        lambda: list(Book.objects.select_related('author').only('id', 'title', 'author__id', 'author__name')),
+        BOOK_LIST_CACHE_TIMEOUT,
+    )
     return render(request, 'bookshelf/list_books.html', {'books': books})
 
 
@@ -46,7 +55,9 @@ def edit_book(request, pk):
     if request.method == 'POST':
         form = BookForm(request.POST, instance=book)
         if form.is_valid():
-            form.save()
+            # UPDATE only the columns that changed (nothing if none did)
+            if form.changed_data:
+                form.save(commit=False).save(update_fields=form.changed_data)
             return redirect('list_books')
     else:
         form = BookForm(instance=book)
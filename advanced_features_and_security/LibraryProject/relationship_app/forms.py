@@ -8,8 +8,13 @@ SECURITY NOTES:
 - SQL injection prevention through ORM usage (no raw queries)
 """
 from django import forms
+from bookshelf.forms import AuthorChoiceField
 from .models import Book, Author
 
+# SECURITY: Characters rejected in free-text fields (HTML tag delimiters)
+HTML_TAG_CHARS = frozenset('<>')
+
+
 class BookForm(forms.ModelForm):
     """
     Form for creating/editing books with comprehensive validation
@@ -27,7 +32,7 @@ class BookForm(forms.ModelForm):
         widget=forms.TextInput(attrs={'class': 'form-control'}),
         help_text='Enter the book title (max 100 characters)'
     )
-    author = forms.ModelChoiceField(
+    author = AuthorChoiceField(
         queryset=Author.objects.all(),
         required=True,
         empty_label='Select an author',
@@ -38,6 +43,12 @@ class BookForm(forms.ModelForm):
         model = Book
         fields = ['title', 'author']
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Options are rendered from (id, name) rows (AuthorChoiceIterator);
+        # a fresh queryset per form so the choices never go stale
+        self.fields['author'].queryset = Author.objects.only('id', 'name').order_by('name')
+    
     def clean_title(self):
         """
         Validate and sanitize book title
@@ -56,7 +67,7 @@ class BookForm(forms.ModelForm):
                 raise forms.ValidationError('Title cannot be empty or only whitespace.')
             # SECURITY: Block HTML tags to prevent XSS attacks
             # Note: Django templates auto-escape, but this adds defense-in-depth
-            if '<' in title or '>' in title:
+            if not HTML_TAG_CHARS.isdisjoint(title):
                 raise forms.ValidationError('Title contains invalid characters.')
         return title
     
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+ROLE_CODES = {'Admin': 1, 'Librarian': 2, 'Member': 3}
+
+
+def role_names_to_codes(apps, schema_editor):
+    UserProfile = apps.get_model('relationship_app', 'UserProfile')
+    for name, code in ROLE_CODES.items():
+        UserProfile.objects.filter(role=name).update(role_code=code)
+
+
+def role_codes_to_names(apps, schema_editor):
+    UserProfile = apps.get_model('relationship_app', 'UserProfile')
+    for name, code in ROLE_CODES.items():
+        UserProfile.objects.filter(role_code=code).update(role=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('relationship_app', '0002_customuser_email_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='role_code',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Admin'), (2, 'Librarian'), (3, 'Member')], db_index=True, null=True),
+        ),
+        migrations.RunPython(role_names_to_codes, role_codes_to_names),
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='role',
+        ),
+        migrations.RenameField(
+            model_name='userprofile',
+            old_name='role_code',
+            new_name='role',
+        ),
+    ]
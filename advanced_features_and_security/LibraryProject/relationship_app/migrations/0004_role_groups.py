@@ -0,0 +1,52 @@
+# Generated by Django 6.0.1 on 2026-10-15 12:30
+
+from django.db import migrations
+
+# Book.Meta.permissions, created here because post_migrate, which normally
+# creates them, only runs after every migration
+BOOK_PERMISSIONS = {
+    'can_add_book': 'Can add book',
+    'can_change_book': 'Can change book',
+    'can_delete_book': 'Can delete book',
+}
+
+# Group name (UserProfile.Role label) -> Book permission codenames
+ROLE_PERMISSIONS = {
+    'Admin': ['can_add_book', 'can_change_book', 'can_delete_book'],
+    'Librarian': ['can_add_book', 'can_change_book'],
+    'Member': [],
+}
+
+
+def create_role_groups(apps, schema_editor):
+    Group = apps.get_model('auth', 'Group')
+    Permission = apps.get_model('auth', 'Permission')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    content_type, _ = ContentType.objects.get_or_create(app_label='relationship_app', model='book')
+    for codename, name in BOOK_PERMISSIONS.items():
+        Permission.objects.get_or_create(codename=codename, content_type=content_type, defaults={'name': name})
+
+    for name, codenames in ROLE_PERMISSIONS.items():
+        group, _ = Group.objects.get_or_create(name=name)
+        group.permissions.set(Permission.objects.filter(
+            codename__in=codenames,
+            content_type=content_type
+        ))
+
+
+def delete_role_groups(apps, schema_editor):
+    Group = apps.get_model('auth', 'Group')
+    Group.objects.filter(name__in=ROLE_PERMISSIONS).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('relationship_app', '0003_userprofile_role_integer'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_role_groups, delete_role_groups),
+    ]
@@ -1,11 +1,10 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
-from django.contrib.auth.models import Permission
+from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
-from django.contrib.auth.models import Group
 
 from django.contrib.auth.base_user import BaseUserManager
 
@@ -40,6 +39,12 @@ class CustomUser(AbstractUser):
     date_of_birth = models.DateField(null=True, blank=True)
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        # emailbackend looks users up by email on every login attempt
+        indexes = [
+            models.Index(fields=['email'], name='relationship_user_email_idx'),
+        ]
+
 # Create your models here.
 class Author(models.Model):
     name = models.CharField(max_length=100)
@@ -84,17 +89,27 @@ class Librarian(models.Model):
         return self.name
 
 class UserProfile(models.Model):
-    ROLES = [
-        ('Admin', 'Admin'),
-        ('Librarian', 'Librarians'),
-        ('Member', 'Member'),
-    ]
+    # Stored as a small integer; the label doubles as the role's group name
+    class Role(models.IntegerChoices):
+        ADMIN = 1, 'Admin'
+        LIBRARIAN = 2, 'Librarian'
+        MEMBER = 3, 'Member'
+
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
-    role = models.CharField(max_length=100, choices=ROLES)
+    # Null until a role is given; new profiles start without one
+    role = models.PositiveSmallIntegerField(choices=Role.choices, null=True, blank=True, db_index=True)
 
     def __str__(self):
         return self.user.username
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The stored role, so update_role_group can tell whether a save changed it
+        if 'role' in field_names:
+            instance._loaded_role = instance.role
+        return instance
+
     class Meta:
         verbose_name = 'User Profile'
         verbose_name_plural = 'User Profiles'
@@ -102,37 +117,72 @@ class UserProfile(models.Model):
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_profile(sender, instance, created, **kwargs):
+    # A new user gets its profile here, without a role; saving an existing
+    # user does not touch it
     if created:
         UserProfile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def save_user_profile(sender, instance, **kwargs):
-    instance.profile.save()
-
-
-
-@receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def assign_group(sender, instance, created, **kwargs):
+@receiver(post_save, sender=UserProfile)
+def update_role_group(sender, instance, created, update_fields=None, **kwargs):
+    # Moves the user from the group of their previous role to that of the new
+    # one. Saves that leave role out or unchanged do not touch the groups
+    if update_fields is not None and 'role' not in update_fields:
+        return
     if created:
-        role = instance.profile.role
-        group, created_group = Group.objects.get_or_create(name=role)
-
-        if created_group:
-            content_type = ContentType.objects.get_for_model(Book)
-
-            if role == 'Admin':
-                perms = ['can_add_book', 'can_change_book', 'can_delete_book']
-            elif role == 'Librarian':
-                perms = ['can_add_book', 'can_change_book']
-            else:
-                perms = []
-
-            for codename in perms:
-                permission = Permission.objects.get(
-                    codename=codename,
-                    content_type=content_type
-                )
-                group.permissions.add(permission)
-
-        instance.groups.add(group)
+        previous_roles = []
+    elif hasattr(instance, '_loaded_role'):
+        if instance._loaded_role == instance.role:
+            return
+        previous_roles = [] if instance._loaded_role is None else [instance._loaded_role]
+    else:
+        # Loaded without its role, so the previous one is unknown
+        previous_roles = [role for role in UserProfile.Role if role != instance.role]
+    if previous_roles:
+        # Groups that no longer exist are simply skipped
+        instance.user.groups.remove(*Group.objects.filter(
+            name__in=[UserProfile.Role(role).label for role in previous_roles]
+        ))
+    if instance.role is not None:
+        assign_group(instance.user, instance.role)
+    instance._loaded_role = instance.role
+
+
+# Role -> Book permission codenames, for a role group that has to be created
+# again at runtime; migration 0004_role_groups creates them in the first place
+ROLE_PERMISSIONS = {
+    UserProfile.Role.ADMIN: ['can_add_book', 'can_change_book', 'can_delete_book'],
+    UserProfile.Role.LIBRARIAN: ['can_add_book', 'can_change_book'],
+    UserProfile.Role.MEMBER: [],
+}
+
+# Role -> Group pk, looked up once. The cache is per process: it is cleared
+# when this process deletes a Group or flushes the database (post_migrate),
+# but other workers keep their pks until restarted, so restart them after
+# deleting a role group
+_role_group_ids = {}
+
+
+def role_group_id(role):
+    """Returns the pk of the group for role, creating the group if it is missing."""
+    group_id = _role_group_ids.get(role)
+    if group_id is None:
+        group, created = Group.objects.get_or_create(name=UserProfile.Role(role).label)
+        if created:
+            group.permissions.set(Permission.objects.filter(
+                codename__in=ROLE_PERMISSIONS[role],
+                content_type=ContentType.objects.get_for_model(Book)
+            ))
+        group_id = _role_group_ids[role] = group.pk
+    return group_id
+
+
+@receiver(post_delete, sender=Group)
+@receiver(post_migrate)
+def forget_role_group_ids(sender, **kwargs):
+    _role_group_ids.clear()
+
+
+def assign_group(instance, role):
+    """Adds the user to the group for role."""
+    instance.groups.add(role_group_id(role))
@@ -12,9 +12,11 @@ These tests verify that security measures are properly implemented:
 
 from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 from django.http import Http404
-from .models import Book, Author, CustomUser, UserProfile
+from .models import Book, Author, CustomUser, Library, UserProfile, forget_role_group_ids
 from .forms import BookForm
 
 User = get_user_model()
@@ -23,22 +25,24 @@ User = get_user_model()
 class CSRFProtectionTests(TestCase):
     """Test CSRF protection on POST requests"""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Test Author")
+        cls.user = User.objects.create_user(username='testuser', password='testpass123')
+        # Create user profile
+        UserProfile.objects.create(user=cls.user, role=UserProfile.Role.ADMIN)
+        cls.add_book_permission = Permission.objects.get(
+            codename='can_add_book', content_type=ContentType.objects.get_for_model(Book)
+        )
+    
     def setUp(self):
         self.client = Client(enforce_csrf_checks=True)
-        self.author = Author.objects.create(name="Test Author")
-        self.user = User.objects.create_user(username='testuser', password='testpass123')
-        # Create user profile
-        UserProfile.objects.create(user=self.user, role='Admin')
         
     def test_csrf_protection_on_add_book(self):
         """Test that POST requests without CSRF token are rejected"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         # Grant permission
-        from django.contrib.auth.models import Permission
-        from django.contrib.contenttypes.models import ContentType
-        content_type = ContentType.objects.get_for_model(Book)
-        permission = Permission.objects.get(codename='can_add_book', content_type=content_type)
-        self.user.user_permissions.add(permission)
+        self.user.user_permissions.add(self.add_book_permission)
         
         # Try to POST without CSRF token
         response = self.client.post(
@@ -51,7 +55,7 @@ class CSRFProtectionTests(TestCase):
     
     def test_csrf_token_in_forms(self):
         """Test that forms include CSRF tokens"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         response = self.client.get(reverse('add_book'))
         # Check that response contains csrf token
         self.assertContains(response, 'csrfmiddlewaretoken', msg_prefix="Forms should include CSRF tokens")
@@ -60,8 +64,9 @@ class CSRFProtectionTests(TestCase):
 class XSSPreventionTests(TestCase):
     """Test XSS prevention in forms and templates"""
     
-    def setUp(self):
-        self.author = Author.objects.create(name="Test Author")
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Test Author")
     
     def test_xss_prevention_in_book_title(self):
         """Test that XSS attempts in book title are blocked"""
@@ -93,9 +98,15 @@ class XSSPreventionTests(TestCase):
 class SQLInjectionPreventionTests(TestCase):
     """Test SQL injection prevention through ORM usage"""
     
-    def setUp(self):
-        self.author = Author.objects.create(name="Test Author")
-        self.book = Book.objects.create(title="Test Book", author=self.author)
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Test Author")
+        # The second title contains a quote, which the ORM must insert and
+        # match as plain data
+        cls.book, _ = Book.objects.bulk_create([
+            Book(title="Test Book", author=cls.author),
+            Book(title="Test's Book", author=cls.author),
+        ])
     
     def test_orm_prevents_sql_injection_in_pk(self):
         """Test that ORM prevents SQL injection in primary key lookups"""
@@ -118,7 +129,6 @@ class SQLInjectionPreventionTests(TestCase):
         self.assertEqual(books.count(), 1)
         
         # Even with special characters, ORM handles it safely
-        Book.objects.create(title="Test's Book", author=self.author)
         books = Book.objects.filter(title="Test's Book")
         self.assertEqual(books.count(), 1)
 
@@ -126,8 +136,9 @@ class SQLInjectionPreventionTests(TestCase):
 class InputValidationTests(TestCase):
     """Test input validation in forms"""
     
-    def setUp(self):
-        self.author = Author.objects.create(name="Test Author")
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Test Author")
     
     def test_empty_title_rejected(self):
         """Test that empty titles are rejected"""
@@ -159,10 +170,13 @@ class InputValidationTests(TestCase):
 class AuthenticationTests(TestCase):
     """Test authentication and authorization"""
     
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(username='testuser', password='testpass123')
-        UserProfile.objects.create(user=self.user, role='Member')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', password='testpass123')
+        UserProfile.objects.create(user=cls.user, role=UserProfile.Role.MEMBER)
+        cls.add_book_permission = Permission.objects.get(
+            codename='can_add_book', content_type=ContentType.objects.get_for_model(Book)
+        )
     
     def test_login_requires_authentication(self):
         """Test that protected views require authentication"""
@@ -174,20 +188,16 @@ class AuthenticationTests(TestCase):
     
     def test_authenticated_user_can_access(self):
         """Test that authenticated users can access protected views"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         # Grant permission
-        from django.contrib.auth.models import Permission
-        from django.contrib.contenttypes.models import ContentType
-        content_type = ContentType.objects.get_for_model(Book)
-        permission = Permission.objects.get(codename='can_add_book', content_type=content_type)
-        self.user.user_permissions.add(permission)
+        self.user.user_permissions.add(self.add_book_permission)
         
         response = self.client.get(reverse('add_book'))
         self.assertEqual(response.status_code, 200, "Authenticated users should access protected views")
     
     def test_permission_required_enforced(self):
         """Test that permission requirements are enforced"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         # User doesn't have permission
         response = self.client.get(reverse('add_book'))
         # Should be forbidden (403) or redirect
@@ -197,9 +207,6 @@ class AuthenticationTests(TestCase):
 class CSPHeaderTests(TestCase):
     """Test Content Security Policy headers"""
     
-    def setUp(self):
-        self.client = Client()
-    
     def test_csp_header_present(self):
         """Test that CSP header is present in responses"""
         response = self.client.get(reverse('list_books'))
@@ -219,9 +226,6 @@ class CSPHeaderTests(TestCase):
 class SecurityHeadersTests(TestCase):
     """Test security headers are present"""
     
-    def setUp(self):
-        self.client = Client()
-    
     def test_x_frame_options_header(self):
         """Test that X-Frame-Options header is present"""
         response = self.client.get(reverse('list_books'))
@@ -241,10 +245,10 @@ class SecurityHeadersTests(TestCase):
 class InformationDisclosureTests(TestCase):
     """Test that information disclosure is prevented"""
     
-    def setUp(self):
-        self.client = Client()
-        self.author = Author.objects.create(name="Test Author")
-        self.book = Book.objects.create(title="Test Book", author=self.author)
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Test Author")
+        cls.book = Book.objects.create(title="Test Book", author=cls.author)
     
     def test_404_on_nonexistent_book(self):
         """Test that 404 is returned instead of 500 for nonexistent books"""
@@ -265,8 +269,9 @@ class InformationDisclosureTests(TestCase):
 class EmailValidationTests(TestCase):
     """Test email validation in authentication backend"""
     
-    def setUp(self):
-        self.user = CustomUser.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -290,3 +295,94 @@ class EmailValidationTests(TestCase):
         result = backend.authenticate(None, username='test@example.com', password='testpass123')
         self.assertIsNotNone(result, "Valid email should be accepted")
         self.assertEqual(result, self.user, "Should return correct user")
+
+
+class QueryCountTests(TestCase):
+    """Test that list and detail pages do not query once per book (N+1)"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="Test Author")
+        books = Book.objects.bulk_create([
+            Book(title=f"Book {i}", author=cls.author) for i in range(10)
+        ])
+        cls.library = Library.objects.create(name="Test Library")
+        cls.library.books.add(*books)
+    
+    def test_list_books_constant_queries(self):
+        """Test that the book list loads books and authors in one query"""
+        # 'list_books' is also a bookshelf URL name, so use the path; secure=True
+        # because SECURE_SSL_REDIRECT would answer a plain request with a 301
+        with self.assertNumQueries(1):
+            response = self.client.get('/relationship_app/books/', secure=True)
+        self.assertContains(response, "Book 9 by Test Author")
+    
+    def test_library_detail_constant_queries(self):
+        """Test that the library page loads the library, then its books with authors"""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('library_detail', kwargs={'pk': self.library.pk}), secure=True)
+        self.assertContains(response, "Book 9 by Test Author")
+
+
+class RoleGroupTests(TestCase):
+    """Test that a profile's role puts its user in that role's group only"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='roleuser')
+        cls.profile = UserProfile.objects.get(user=cls.user)
+    
+    def set_role(self, role):
+        self.profile.role = role
+        self.profile.save()
+        # Reload so the permissions are read again
+        return User.objects.get(pk=self.user.pk)
+    
+    def test_new_profile_has_no_role_group(self):
+        """Test that a new user's profile has no role and no role permissions"""
+        self.assertIsNone(self.profile.role)
+        self.assertFalse(self.user.has_perm('relationship_app.can_add_book'))
+    
+    def test_setting_role_adds_group(self):
+        """Test that saving a role grants that role's permissions"""
+        user = self.set_role(UserProfile.Role.LIBRARIAN)
+        self.assertTrue(user.has_perm('relationship_app.can_add_book'))
+        self.assertFalse(user.has_perm('relationship_app.can_delete_book'))
+    
+    def test_changing_role_replaces_group(self):
+        """Test that changing the role removes the previous role's group"""
+        self.set_role(UserProfile.Role.ADMIN)
+        user = self.set_role(UserProfile.Role.MEMBER)
+        self.assertFalse(user.has_perm('relationship_app.can_add_book'))
+        self.assertFalse(user.has_perm('relationship_app.can_delete_book'))
+    
+    def test_unchanged_role_leaves_groups_alone(self):
+        """Test that saving a profile without changing its role issues only the UPDATE"""
+        self.set_role(UserProfile.Role.LIBRARIAN)
+        profile = UserProfile.objects.get(pk=self.profile.pk)
+        with self.assertNumQueries(1):
+            profile.save()
+    
+    def test_recreated_group_used(self):
+        """Test that a role group deleted and created again is looked up again"""
+        # The rollback restores the original group without sending signals
+        self.addCleanup(forget_role_group_ids, sender=Group)
+        self.set_role(UserProfile.Role.LIBRARIAN)
+        self.set_role(UserProfile.Role.MEMBER)
+        librarian = Group.objects.get(name='Librarian')
+        permissions = list(librarian.permissions.all())
+        librarian.delete()
+        Group.objects.create(name='Librarian').permissions.set(permissions)
+        
+        user = self.set_role(UserProfile.Role.LIBRARIAN)
+        self.assertTrue(user.has_perm('relationship_app.can_add_book'))
+    
+    def test_missing_groups_recreated(self):
+        """Test that role changes still work after the role groups were deleted"""
+        self.addCleanup(forget_role_group_ids, sender=Group)
+        self.set_role(UserProfile.Role.ADMIN)
+        Group.objects.filter(name__in=UserProfile.Role.labels).delete()
+        
+        user = self.set_role(UserProfile.Role.LIBRARIAN)
+        self.assertTrue(user.has_perm('relationship_app.can_add_book'))
+        self.assertFalse(user.has_perm('relationship_app.can_delete_book'))
@@ -11,6 +11,7 @@ SECURITY NOTES:
 from django.shortcuts import render, get_object_or_404
 from .models import Book, Author
 from .models import Library
+from django.db.models import Prefetch
 from django.http import HttpResponse
 from django.views.generic import ListView
 from django.views.generic.detail import DetailView
@@ -23,7 +24,7 @@ from django.shortcuts import redirect
 from django.views.generic import View
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.decorators import user_passes_test
-from .models import CustomUser
+from .models import CustomUser, UserProfile
 from .forms import BookForm
 
 from django.contrib.auth.decorators import permission_required
@@ -33,7 +34,11 @@ from django.core.validators import validate_email
 
 # Create your views here.
 def list_books(request):
-    books = Book.objects.all()
+    # The template prints book.author.name for every book: join the author
+    # into the same query and load only the columns the template reads.
+    # The template loops over the books once, so stream them in chunks
+    # instead of holding every row in the queryset's result cache
+    books = Book.objects.select_related('author').only('id', 'title', 'author__id', 'author__name').iterator(chunk_size=500)
     return render(request, 'relationship_app/list_books.html', {'books': books})
 
 class LibraryDetailView(DetailView):
@@ -41,6 +46,13 @@ class LibraryDetailView(DetailView):
     template_name = 'relationship_app/library_detail.html'
     context_object_name = 'library'
 
+    def get_queryset(self):
+        # Load the library's books, with their authors joined in, in one
+        # extra query; the template prints book.author.name for each book
+        return Library.objects.prefetch_related(
+            Prefetch('books', queryset=Book.objects.select_related('author'))
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['books'] = self.object.books.all()
@@ -93,18 +105,30 @@ class LogoutView(View):
 
 from django.contrib.auth.decorators import login_required
 
+def has_role(role):
+    """
+    Returns a user_passes_test check for users whose profile has role
+    
+    A single EXISTS query on the profile table, instead of loading the whole
+    profile through the reverse one-to-one (and catching its DoesNotExist
+    for users without one).
+    """
+    def check(user):
+        return UserProfile.objects.filter(user_id=user.pk, role=role).exists()
+    return check
+
 @login_required
-@user_passes_test(lambda u: hasattr(u, 'profile') and u.profile.role == 'Admin')
+@user_passes_test(has_role(UserProfile.Role.ADMIN))
 def Admin(request):
     return render(request, 'relationship_app/admin_view.html')
 
 @login_required 
-@user_passes_test(lambda u: hasattr(u, 'profile') and u.profile.role == 'Librarians')
+@user_passes_test(has_role(UserProfile.Role.LIBRARIAN))
 def Librarian(request):
     return render(request, 'relationship_app/librarian_view.html')
 
 @login_required
-@user_passes_test(lambda u: hasattr(u, 'profile') and u.profile.role == 'Member')
+@user_passes_test(has_role(UserProfile.Role.MEMBER))
 def Member(request):
     return render(request, 'relationship_app/member_view.html')
 
@@ -138,7 +162,9 @@ def edit_book(request, pk):
         # SECURITY: Form validation ensures all inputs are safe
         form = BookForm(request.POST, instance=book)
         if form.is_valid():
-            form.save()
+            # UPDATE only the columns that changed (nothing if none did)
+            if form.changed_data:
+                form.save(commit=False).save(update_fields=form.changed_data)
             return redirect('list_books')
     else:
         form = BookForm(instance=book)
@@ -177,8 +203,9 @@ class emailbackend(BaseBackend):
     - Exception handling: Prevents information disclosure
     """
     def authenticate(self, request, username=None, password=None):
-        # SECURITY: Validate inputs before processing
-        if not username or not password:
+        # SECURITY: Validate inputs before processing; anything without an
+        # '@' cannot be an email, so skip the validator's regexes for it
+        if not username or not password or '@' not in username:
             return None
         
         # SECURITY: Validate email format to prevent injection attacks
@@ -192,7 +219,8 @@ class emailbackend(BaseBackend):
         # Returns None instead of raising exception (doesn't reveal if user exists)
         try:
             # SECURITY: ORM automatically parameterizes queries (SQL injection prevention)
-            user = CustomUser.objects.get(email=username)
+            # Only the columns authenticate() and login() read
+            user = CustomUser.objects.only('id', 'password', 'email', 'is_active').get(email=username)
             # SECURITY: Django's check_password uses secure hashing (bcrypt, etc.)
             if user and user.check_password(password):
                 return user
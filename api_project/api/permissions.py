@@ -2,6 +2,13 @@ from rest_framework.permissions import BasePermission
 from rest_framework.permissions import SAFE_METHODS
 
 class IsAdminUser(BasePermission):
+    # Checked before the view runs: a non-superuser's write is rejected
+    # without loading the queryset or the object
+    def has_permission(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        return bool(request.user and request.user.is_superuser)
+
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
@@ -115,39 +115,34 @@ class UserProfile(models.Model):
         verbose_name_plural = 'User Profiles'
 
 
+# Book permissions granted to each role's group when the group is created
+ROLE_PERMISSIONS = {
+    'Admin': ['can_add_book', 'can_change_book', 'can_delete_book'],
+    'Librarian': ['can_add_book', 'can_change_book'],
+}
+
+
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_profile(sender, instance, created, **kwargs):
+    # The only user post_save handler; saving an existing user no longer
+    # re-saves its profile
     if created:
         UserProfile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def save_user_profile(sender, instance, **kwargs):
-    instance.profile.save()
-
-
-
-@receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def assign_group(sender, instance, created, **kwargs):
-    if created:
-        role = instance.profile.role
+@receiver(post_save, sender=UserProfile)
+def assign_group(sender, instance, **kwargs):
+    # A new profile has no role yet, so the group is assigned once the
+    # profile is saved with one
+    role = instance.role
+    if role:
         group, created_group = Group.objects.get_or_create(name=role)
 
         if created_group:
-            content_type = ContentType.objects.get_for_model(Book)
-
-            if role == 'Admin':
-                perms = ['can_add_book', 'can_change_book', 'can_delete_book']
-            elif role == 'Librarian':
-                perms = ['can_add_book', 'can_change_book']
-            else:
-                perms = []
-
-            for codename in perms:
-                permission = Permission.objects.get(
-                    codename=codename,
-                    content_type=content_type
-                )
-                group.permissions.add(permission)
-
-        instance.groups.add(group)
+            # One SELECT for all the role's permissions and one M2M insert
+            group.permissions.add(*Permission.objects.filter(
+                codename__in=ROLE_PERMISSIONS.get(role, []),
+                content_type=ContentType.objects.get_for_model(Book)
+            ))
+
+        instance.user.groups.add(group)
@@ -1,6 +1,7 @@
 from django.shortcuts import render
 from .models import Book, Author
 from .models import Library
+from django.db.models import Prefetch
 from django.http import HttpResponse
 from django.views.generic import ListView
 from django.views.generic.detail import DetailView
@@ -13,7 +14,7 @@ from django.shortcuts import redirect
 from django.views.generic import View
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.decorators import user_passes_test
-from .models import CustomUser
+from .models import CustomUser, UserProfile
 from .forms import BookForm
 
 from django.contrib.auth.decorators import permission_required
@@ -21,7 +22,9 @@ from django.contrib.auth.backends import BaseBackend
 
 # Create your views here.
 def list_books(request):
-    books = Book.objects.all()
+    # The template prints book.author.name for every book: join the author
+    # into the same query and load only the columns the template reads
+    books = Book.objects.select_related('author').only('id', 'title', 'author__id', 'author__name')
     return render(request, 'relationship_app/list_books.html', {'books': books})
 
 class LibraryDetailView(DetailView):
@@ -29,6 +32,13 @@ class LibraryDetailView(DetailView):
     template_name = 'relationship_app/library_detail.html'
     context_object_name = 'library'
 
+    def get_queryset(self):
+        # Load the library's books, with their authors joined in, in one
+        # extra query; the template prints book.author.name for each book
+        return Library.objects.prefetch_related(
+            Prefetch('books', queryset=Book.objects.select_related('author'))
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['books'] = self.object.books.all()
@@ -68,18 +78,30 @@ class LogoutView(View):
 
 from django.contrib.auth.decorators import login_required
 
+def has_role(role):
+    """
+    Returns a user_passes_test check for users whose profile has role
+    
+    A single EXISTS query on the profile table, instead of loading the whole
+    profile through the reverse one-to-one (and catching its DoesNotExist
+    for users without one).
+    """
+    def check(user):
+        return UserProfile.objects.filter(user_id=user.pk, role=role).exists()
+    return check
+
 @login_required
-@user_passes_test(lambda u: hasattr(u, 'profile') and u.profile.role == 'Admin')
+@user_passes_test(has_role('Admin'))
 def Admin(request):
     return render(request, 'relationship_app/admin_view.html')
 
 @login_required 
-@user_passes_test(lambda u: hasattr(u, 'profile') and u.profile.role == 'Librarians')
+@user_passes_test(has_role('Librarian'))
 def Librarian(request):
     return render(request, 'relationship_app/librarian_view.html')
 
 @login_required
-@user_passes_test(lambda u: hasattr(u, 'profile') and u.profile.role == 'Member')
+@user_passes_test(has_role('Member'))
 def Member(request):
     return render(request, 'relationship_app/member_view.html')
 
@@ -119,7 +141,8 @@ def delete_book(request, pk):
 class emailbackend(BaseBackend):
     def authenticate(self,request,username=None,password=None):
         try:
-            user = CustomUser.objects.get(email=username)
+            # Only the columns authenticate() and login() read
+            user = CustomUser.objects.only('id', 'password', 'email', 'is_active').get(email=username)
             if user and user.check_password(password):
                 return user
             else: